@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 from csv import reader
 
 from ff5_wiki.enemy import FF5Enemy
@@ -11,10 +11,36 @@ class FF5Bestiary():
     '''
     __READY_ONLY_ERROR_MSG: str = "This attribute cannot be changed after initialisation."
     __BESTIARY_LINE_LENGTH: int = 6  # Expected number of columns in the bestiary CSV files.
+    __OVERLAY_LINE_LENGTH: int = 8  # Expected number of columns in the overlay CSV files (action and boss flag, followed by a bestiary line).
+    __OVERLAY_REMOVE_LINE_LENGTH: int = 3  # A removal only needs the action, the boss flag and the name.
+    __OVERLAY_ACTIONS: tuple[str, ...] = ("add", "replace", "remove")
+    __OVERLAY_BOSS_FLAGS: tuple[str, ...] = ("0", "1")
 
     def __init__(self, enemy_list_file: str, boss_list_file: str) -> None:
-        self.__enemies: list[FF5Enemy] = self.__init_enemies(enemy_list_file=enemy_list_file, boss_flag=False)
-        self.__bosses: list[FF5Enemy] = self.__init_enemies(enemy_list_file=boss_list_file, boss_flag=True)
+        enemies: list[FF5Enemy] = self.__init_enemies(enemy_list_file=enemy_list_file, boss_flag=False)
+        bosses: list[FF5Enemy] = self.__init_enemies(enemy_list_file=boss_list_file, boss_flag=True)
+
+        self.__init_layer(enemies=enemies, bosses=bosses, item_index=FF5Bestiary.__build_item_index(all_enemies=enemies + bosses, items=None), touched_items=frozenset())
+
+    @classmethod
+    def __from_layer(cls, enemies: list[FF5Enemy], bosses: list[FF5Enemy], item_index: dict[str, tuple[FF5Enemy, ...]], touched_items: frozenset[str]) -> "FF5Bestiary":
+        '''
+        Build a bestiary from already computed parts, without reading the CSV files. Used to derive the bestiaries of other versions via overlays.
+        '''
+        bestiary: FF5Bestiary = cls.__new__(cls)
+
+        bestiary.__init_layer(enemies=enemies, bosses=bosses, item_index=item_index, touched_items=touched_items)
+
+        return bestiary
+
+    def __init_layer(self, enemies: list[FF5Enemy], bosses: list[FF5Enemy], item_index: dict[str, tuple[FF5Enemy, ...]], touched_items: frozenset[str]) -> None:
+        '''
+        Set all the attributes of the bestiary. Both `__init__` and `__from_layer` go through this method.
+        '''
+        self.__enemies: list[FF5Enemy] = enemies
+        self.__bosses: list[FF5Enemy] = bosses
+        self.__item_index: dict[str, tuple[FF5Enemy, ...]] = item_index
+        self.__touched_items: frozenset[str] = touched_items
 
     @property
     def enemies(self) -> list[FF5Enemy]:
@@ -49,6 +75,95 @@ class FF5Bestiary():
     def all_enemies(self, _: Any) -> None:
         raise AttributeError(FF5Bestiary.__READY_ONLY_ERROR_MSG)
 
+    @property
+    def touched_items(self) -> frozenset[str]:
+        '''
+        The items whose drop/steal sources differ from those of the base bestiary this one was derived from via an overlay.
+        Always empty for a bestiary loaded directly from the CSV files.
+        '''
+        return self.__touched_items
+
+    @touched_items.setter
+    def touched_items(self, _: Any) -> None:
+        raise AttributeError(FF5Bestiary.__READY_ONLY_ERROR_MSG)
+
+    def get_enemies_with_item(self, item: str) -> tuple[FF5Enemy, ...]:
+        '''
+        Returns the enemies and bosses that may drop the item or have it stolen from them, in bestiary order.
+        Args:
+            item (str): The name of the item.
+        Returns:
+            tuple[FF5Enemy, ...]: The enemies and bosses referencing the item (regular enemies first).
+        '''
+        return self.__item_index.get(item, ())
+
+    def apply_overlay(self, overlay_file: str) -> "FF5Bestiary":
+        '''
+        Derive the bestiary of another version of the game from this one, given an overlay file describing only the rows that differ.
+        The derived bestiary is a copy-on-write layer: unchanged FF5Enemy records and item index entries are shared with this bestiary, which is left untouched.
+        Each overlay line has the following columns: Action (add, replace or remove), Boss (0 or 1), followed by the usual bestiary columns.
+        A removal may omit the columns after the name.
+        A replaced enemy keeps its position, an added enemy is appended to the enemies or the bosses, depending on the boss flag.
+        Args:
+            overlay_file (str): The path to the overlay CSV file.
+        Returns:
+            FF5Bestiary: The derived bestiary.
+        Raises:
+            ValueError: If an overlay line has the wrong number of columns, an unknown action or boss flag, invalid enemy values, adds an existing enemy, or replaces/removes a missing one.
+        '''
+        enemies: list[FF5Enemy] = list(self.__enemies)
+        bosses: list[FF5Enemy] = list(self.__bosses)
+        touched_items: set[str] = set()
+
+        with open(overlay_file, "r") as i_f:
+            lines = reader(i_f)
+
+            for line in lines:
+                if not any(line) or line[0] == "Action":
+                    continue
+
+                location: str = f"{overlay_file}, line {lines.line_num}"
+                action, boss, *bestiary_line = line + [""] * (FF5Bestiary.__OVERLAY_LINE_LENGTH - len(line))
+
+                if action not in FF5Bestiary.__OVERLAY_ACTIONS:
+                    raise ValueError(f"Unknown overlay action \"{action}\" in {location}.")
+                elif len(line) != FF5Bestiary.__OVERLAY_LINE_LENGTH and not (action == "remove" and len(line) == FF5Bestiary.__OVERLAY_REMOVE_LINE_LENGTH):
+                    raise ValueError(f"Expected {FF5Bestiary.__OVERLAY_LINE_LENGTH} columns ({FF5Bestiary.__OVERLAY_REMOVE_LINE_LENGTH} for a removal), got {len(line)} in {location}.")
+                elif boss not in FF5Bestiary.__OVERLAY_BOSS_FLAGS:
+                    raise ValueError(f"Unknown boss flag \"{boss}\" in {location}: expected 0 or 1.")
+
+                boss_flag: bool = boss == "1"
+                target: list[FF5Enemy] = bosses if boss_flag else enemies
+                position: int = next((i for i, enemy in enumerate(target) if enemy.name == bestiary_line[0]), -1)
+
+                if action == "add" and position >= 0:
+                    raise ValueError(f"Cannot add the \"{bestiary_line[0]}\" enemy in {location}: it is already in the bestiary.")
+                elif action != "add" and position < 0:
+                    raise ValueError(f"Cannot {action} the \"{bestiary_line[0]}\" enemy in {location}: it is not in the bestiary.")
+
+                if position >= 0:
+                    touched_items.update(FF5Bestiary.__get_items(enemy=target[position]))
+
+                if action == "remove":
+                    del target[position]
+                    continue
+
+                try:
+                    enemy: FF5Enemy = FF5Bestiary.__parse_line(line=bestiary_line, boss_flag=boss_flag)
+                except ValueError as e:
+                    raise ValueError(f"Invalid enemy in {location}: {e}") from e
+
+                touched_items.update(FF5Bestiary.__get_items(enemy=enemy))
+
+                if action == "add":
+                    target.append(enemy)
+                else:
+                    target[position] = enemy
+
+        item_index: dict[str, tuple[FF5Enemy, ...]] = self.__item_index | FF5Bestiary.__build_item_index(all_enemies=enemies + bosses, items=touched_items)
+
+        return FF5Bestiary.__from_layer(enemies=enemies, bosses=bosses, item_index=item_index, touched_items=frozenset(touched_items))
+
     def __init_enemies(self, enemy_list_file: str, boss_flag: bool) -> list[FF5Enemy]:
         enemies: list[FF5Enemy] = []
 
@@ -57,9 +172,37 @@ class FF5Bestiary():
                 if not line or len(line) != FF5Bestiary.__BESTIARY_LINE_LENGTH or line[0] == "Name":
                     continue
 
-                name, wiki_page_type, common_steal, rare_steal, common_drop, rare_drop = line
-
-                if name:
-                    enemies.append(FF5Enemy(name=name, is_boss=boss_flag, wiki_page_type=wiki_page_type, common_steal=common_steal, rare_steal=rare_steal, common_drop=common_drop, rare_drop=rare_drop))
+                if line[0]:
+                    enemies.append(FF5Bestiary.__parse_line(line=line, boss_flag=boss_flag))
 
         return enemies
+
+    @staticmethod
+    def __parse_line(line: list[str], boss_flag: bool) -> FF5Enemy:
+        name, wiki_page_type, common_steal, rare_steal, common_drop, rare_drop = line
+
+        return FF5Enemy(name=name, is_boss=boss_flag, wiki_page_type=wiki_page_type, common_steal=common_steal, rare_steal=rare_steal, common_drop=common_drop, rare_drop=rare_drop)
+
+    @staticmethod
+    def __build_item_index(all_enemies: list[FF5Enemy], items: Optional[set[str]]) -> dict[str, tuple[FF5Enemy, ...]]:
+        '''
+        Map each item to the enemies referencing it, in bestiary order.
+        The entries are tuples, as they are shared between a bestiary and the ones derived from it via overlays.
+        Args:
+            all_enemies (list[FF5Enemy]): All the enemies and bosses of the bestiary, in order.
+            items (Optional[set[str]]): If given, only these items are indexed (and each of them gets an entry, even if empty). Otherwise, all the items are indexed.
+        Returns:
+            dict[str, tuple[FF5Enemy, ...]]: The item index.
+        '''
+        item_index: dict[str, list[FF5Enemy]] = {item: [] for item in items} if items is not None else {}
+
+        for enemy in all_enemies:
+            for item in FF5Bestiary.__get_items(enemy=enemy):
+                if items is None or item in items:
+                    item_index.setdefault(item, []).append(enemy)
+
+        return {item: tuple(enemies) for item, enemies in item_index.items()}
+
+    @staticmethod
+    def __get_items(enemy: FF5Enemy) -> set[str]:
+        return {item for item in (enemy.common_steal, enemy.rare_steal, enemy.common_drop, enemy.rare_drop) if item}
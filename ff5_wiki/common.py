@@ -1,4 +1,4 @@
-from requests import head
+from ff5_wiki.transport import FF5WikiTransport
 
 
 class FF5Wiki():
@@ -6,8 +6,16 @@ class FF5Wiki():
     BOSS_FILE: str = "ff5_wiki/bosses.csv"
     ITEM_FILE: str = "ff5_wiki/items.txt"
 
+    # Each version of the game is described by an overlay file, listing only the rows that differ from the enemy and boss files.
+    # See FF5Bestiary.apply_overlay for the format.
+    # The key is the version name (e.g., "GBA"), and the value is the path to its overlay file.
+    VERSION_OVERLAY_FILES: dict[str, str] = {}
+
     WIKI_MAIN_URL: str = "https://finalfantasy.fandom.com/wiki/"
 
+    # Shared by all the wiki I/O, so that connections are pooled and the request rate is limited globally.
+    TRANSPORT: FF5WikiTransport = FF5WikiTransport()
+
     # The order of these suffixes matters.
     # This is because less specific suffixes might refer to pages non-specific to Final Fantasy V enemies.
     # Bosses suffixes are checked after enemy suffixes to avoid unnecessary checks).
@@ -64,29 +72,33 @@ class FF5Wiki():
     @staticmethod
     def page_exists(title: str, skip: bool=False) -> bool:
         '''
-        May check if a wiki page exists from its title. A HEAD request is used to avoid downloading the entire page content.
+        May check if a wiki page exists from its title. A HEAD request is sent via the shared transport to avoid downloading the entire page content.
         Args:
             title (str): The title of the wiki page to check.
             skip (bool): If True, the function will always return True without checking. Defaults to False.
         Returns:
             bool: True if the page exists, False otherwise.
+        Raises:
+            requests.RequestException: If the wiki kept failing transiently (429, 5xx, connection errors, timeouts) after all retries.
         '''
         if skip:
             return True
         else:
-            return head(f"{FF5Wiki.WIKI_MAIN_URL}{title}").status_code == 200
+            return FF5Wiki.full_page_exists(full_url=f"{FF5Wiki.WIKI_MAIN_URL}{title}")
 
     @staticmethod
     def full_page_exists(full_url: str, skip: bool=False) -> bool:
         '''
-        May check if a wiki page exists given its full URL. A HEAD request is used to avoid downloading the entire page content.
+        May check if a wiki page exists given its full URL. A HEAD request is sent via the shared transport to avoid downloading the entire page content.
         Args:
             full_url (str): The full URL of the wiki page to check.
             skip (bool): If True, the function will always return True without checking. Defaults to False.
         Returns:
             bool: True if the page exists, False otherwise.
+        Raises:
+            requests.RequestException: If the wiki kept failing transiently (429, 5xx, connection errors, timeouts) after all retries.
         '''
         if skip:
             return True
         else:
-            return head(full_url).status_code == 200
+            return FF5Wiki.TRANSPORT.head(url=full_url).status_code == 200
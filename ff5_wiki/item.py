@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, Sequence
 from json import dumps
 
 from ff5_wiki.bestiary import FF5Bestiary
@@ -10,24 +10,29 @@ from ff5_wiki.enemy_steal_nature import EnemyStealNature
 class FF5Item():
     __READY_ONLY_ERROR_MSG: str = "This attribute cannot be changed after initialisation."
 
+    # The prefixes of the wiki-ready sections, in the same order as the `sources` property.
+    SECTION_PREFIXES: tuple[str, ...] = (
+        "'''Guaranteed drop:''' ",
+        "'''Common drop:''' ",
+        "'''Rare drop:''' ",
+        "'''Guaranteed common steal:''' ",
+        "'''Common steal:''' ",
+        "'''Rare steal:''' ",
+        "'''Unique rare steal:''' "
+    )
+    SEPARATOR: str = ", "
+    NEWLINE: str = "<br/>\n"
+
     def __init__(self, name: str, bestiary: FF5Bestiary) -> None:
         self.__name: str = name
         self.__bestiary: FF5Bestiary = bestiary
-        self.__always_dropped_by_prefix: str = "'''Guaranteed drop:''' "
         self.__always_dropped_by: list[FF5Enemy] = []
-        self.__commonly_dropped_by_prefix: str = "'''Common drop:''' "
         self.__commonly_dropped_by: list[FF5Enemy] = []
-        self.__rarely_dropped_by_prefix: str = "'''Rare drop:''' "
         self.__rarely_dropped_by: list[FF5Enemy] = []
-        self.__always_stolen_from_prefix: str = "'''Guaranteed common steal:''' "
         self.__always_stolen_from: list[FF5Enemy] = []
-        self.__commonly_stolen_from_prefix: str = "'''Common steal:''' "
         self.__commonly_stolen_from: list[FF5Enemy] = []
-        self.__rarely_stolen_from_prefix: str = "'''Rare steal:''' "
         self.__rarely_stolen_from: list[FF5Enemy] = []
-        self.__unique_rarely_stolen_from_prefix: str = "'''Unique rare steal:''' "
         self.__unique_rarely_stolen_from: list[FF5Enemy] = []
-        self.__newline: str = "<br/>\n"
 
         self.__populate_enemy_lists()
 
@@ -119,24 +124,48 @@ class FF5Item():
     def unique_rarely_stolen_from(self, _: Any) -> None:
         raise AttributeError(FF5Item.__READY_ONLY_ERROR_MSG)
 
+    @property
+    def sources(self) -> tuple[list[FF5Enemy], ...]:
+        '''
+        All the lists of enemies referencing this item, in the same order as `SECTION_PREFIXES`.
+        '''
+        return (
+            self.__always_dropped_by,
+            self.__commonly_dropped_by,
+            self.__rarely_dropped_by,
+            self.__always_stolen_from,
+            self.__commonly_stolen_from,
+            self.__rarely_stolen_from,
+            self.__unique_rarely_stolen_from
+        )
+
+    @sources.setter
+    def sources(self, _: Any) -> None:
+        raise AttributeError(FF5Item.__READY_ONLY_ERROR_MSG)
+
     def get_wiki_ready_references(self) -> str:
         '''
         Prints the wiki-ready references of all enemies w.r.t. drops and steals for this item.
+        To render many items, prefer FF5WikiReferenceRenderer, which caches the output.
         '''
-        sections: dict[str, list[FF5Enemy]] = {
-            self.__always_dropped_by_prefix: self.__always_dropped_by,
-            self.__commonly_dropped_by_prefix: self.__commonly_dropped_by,
-            self.__rarely_dropped_by_prefix: self.__rarely_dropped_by,
-            self.__always_stolen_from_prefix: self.__always_stolen_from,
-            self.__commonly_stolen_from_prefix: self.__commonly_stolen_from,
-            self.__rarely_stolen_from_prefix: self.__rarely_stolen_from,
-            self.__unique_rarely_stolen_from_prefix: self.__unique_rarely_stolen_from
-        }
+        return FF5Item.render_references(sources=self.sources, section_prefixes=FF5Item.SECTION_PREFIXES, separator=FF5Item.SEPARATOR, newline=FF5Item.NEWLINE)
 
-        return self.__newline.join(prefix + ", ".join(enemy.wiki_link_with_custom_text for enemy in enemies) for prefix, enemies in sections.items() if enemies)
+    @staticmethod
+    def render_references(sources: Iterable[Sequence[FF5Enemy]], section_prefixes: Sequence[str], separator: str, newline: str) -> str:
+        '''
+        Render the wiki-ready references of the given source lists with the given section template. Empty sections are omitted.
+        Args:
+            sources (Iterable[Sequence[FF5Enemy]]): The lists of enemies, in the same order as `SECTION_PREFIXES`.
+            section_prefixes (Sequence[str]): The prefix of each section.
+            separator (str): The separator between the enemies of a section.
+            newline (str): The separator between sections.
+        Returns:
+            str: The wiki-ready references.
+        '''
+        return newline.join(prefix + separator.join(enemy.wiki_link_with_custom_text for enemy in enemies) for prefix, enemies in zip(section_prefixes, sources) if enemies)
 
     def __populate_enemy_lists(self) -> None:
-        for enemy in self.__bestiary.enemies + self.__bestiary.bosses:
+        for enemy in self.__bestiary.get_enemies_with_item(item=self.__name):
             self.__check_stealable_items(enemy=enemy)
             self.__check_droppable_items(enemy=enemy)
 
@@ -0,0 +1,64 @@
+from typing import Any
+from threading import Lock
+from time import monotonic, sleep
+
+
+class FF5WikiRateLimiter():
+    '''
+    A token-bucket rate limiter, used to keep the requests sent to the wiki below the rate at which it starts throttling.
+    The bucket holds at most `capacity` tokens and is refilled at `rate` tokens per second. Each request consumes one token.
+    '''
+    __READY_ONLY_ERROR_MSG: str = "This attribute cannot be changed after initialisation."
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive, got {rate}.")
+        elif capacity < 1:
+            raise ValueError(f"The capacity must be at least 1, got {capacity}.")
+
+        self.__rate: float = rate
+        self.__capacity: int = capacity
+        self.__tokens: float = float(capacity)
+        self.__last_refill: float = monotonic()
+        self.__lock: Lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        '''
+        The number of tokens added to the bucket every second.
+        '''
+        return self.__rate
+
+    @rate.setter
+    def rate(self, _: Any) -> None:
+        raise AttributeError(FF5WikiRateLimiter.__READY_ONLY_ERROR_MSG)
+
+    @property
+    def capacity(self) -> int:
+        '''
+        The maximum number of tokens the bucket can hold (i.e., the maximum burst size).
+        '''
+        return self.__capacity
+
+    @capacity.setter
+    def capacity(self, _: Any) -> None:
+        raise AttributeError(FF5WikiRateLimiter.__READY_ONLY_ERROR_MSG)
+
+    def acquire(self) -> None:
+        '''
+        Consume one token, blocking until one is available.
+        '''
+        with self.__lock:
+            self.__refill()
+
+            if self.__tokens < 1:
+                sleep((1 - self.__tokens) / self.__rate)
+                self.__refill()
+
+            self.__tokens -= 1
+
+    def __refill(self) -> None:
+        now: float = monotonic()
+
+        self.__tokens = min(float(self.__capacity), self.__tokens + (now - self.__last_refill) * self.__rate)
+        self.__last_refill = now
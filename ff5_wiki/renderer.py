@@ -0,0 +1,103 @@
+from typing import Any, Iterable
+from io import StringIO
+
+from ff5_wiki.enemy import FF5Enemy
+from ff5_wiki.item import FF5Item
+
+
+class FF5WikiReferenceRenderer():
+    '''
+    A batch renderer for the wiki-ready references of many items, driven by a configurable section template.
+    The output is cached by the item's source-list fingerprint (i.e., the enemies in each of its sections), so that items referenced by the same enemies
+    (e.g., the same item in two versions of the bestiary that do not differ for it) are only rendered once.
+    '''
+    __READY_ONLY_ERROR_MSG: str = "This attribute cannot be changed after initialisation."
+
+    def __init__(self, section_prefixes: tuple[str, ...]=FF5Item.SECTION_PREFIXES, separator: str=FF5Item.SEPARATOR, newline: str=FF5Item.NEWLINE, item_separator: str="----------") -> None:
+        if len(section_prefixes) != len(FF5Item.SECTION_PREFIXES):
+            raise ValueError(f"Expected {len(FF5Item.SECTION_PREFIXES)} section prefixes, got {len(section_prefixes)}.")
+
+        self.__section_prefixes: tuple[str, ...] = section_prefixes
+        self.__separator: str = separator
+        self.__newline: str = newline
+        self.__item_separator: str = item_separator
+        self.__cache: dict[tuple[tuple[FF5Enemy, ...], ...], str] = {}
+
+    @property
+    def section_prefixes(self) -> tuple[str, ...]:
+        '''
+        The prefixes of the sections, in the same order as `FF5Item.sources`.
+        '''
+        return self.__section_prefixes
+
+    @section_prefixes.setter
+    def section_prefixes(self, _: Any) -> None:
+        raise AttributeError(FF5WikiReferenceRenderer.__READY_ONLY_ERROR_MSG)
+
+    @property
+    def separator(self) -> str:
+        '''
+        The separator between the enemies of a section.
+        '''
+        return self.__separator
+
+    @separator.setter
+    def separator(self, _: Any) -> None:
+        raise AttributeError(FF5WikiReferenceRenderer.__READY_ONLY_ERROR_MSG)
+
+    @property
+    def newline(self) -> str:
+        '''
+        The separator between the sections of an item.
+        '''
+        return self.__newline
+
+    @newline.setter
+    def newline(self, _: Any) -> None:
+        raise AttributeError(FF5WikiReferenceRenderer.__READY_ONLY_ERROR_MSG)
+
+    @property
+    def item_separator(self) -> str:
+        '''
+        The line written after each item of a catalogue.
+        '''
+        return self.__item_separator
+
+    @item_separator.setter
+    def item_separator(self, _: Any) -> None:
+        raise AttributeError(FF5WikiReferenceRenderer.__READY_ONLY_ERROR_MSG)
+
+    def render(self, item: FF5Item) -> str:
+        '''
+        Render the wiki-ready references of all enemies w.r.t. drops and steals for an item, reusing the cached output if possible.
+        Args:
+            item (FF5Item): The item to render.
+        Returns:
+            str: The wiki-ready references.
+        '''
+        fingerprint: tuple[tuple[FF5Enemy, ...], ...] = tuple(tuple(enemies) for enemies in item.sources)
+
+        if fingerprint not in self.__cache:
+            self.__cache[fingerprint] = FF5Item.render_references(sources=fingerprint, section_prefixes=self.__section_prefixes, separator=self.__separator, newline=self.__newline)
+
+        return self.__cache[fingerprint]
+
+    def render_catalogue(self, items: Iterable[FF5Item]) -> str:
+        '''
+        Render the name and the wiki-ready references of many items into a single buffer, each followed by the item separator.
+        Args:
+            items (Iterable[FF5Item]): The items to render.
+        Returns:
+            str: The rendered catalogue.
+        '''
+        buffer: StringIO = StringIO()
+
+        for item in items:
+            buffer.write(item.name)
+            buffer.write("\n")
+            buffer.write(self.render(item=item))
+            buffer.write("\n")
+            buffer.write(self.__item_separator)
+            buffer.write("\n")
+
+        return buffer.getvalue()
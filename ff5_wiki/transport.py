@@ -0,0 +1,210 @@
+from typing import Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import sleep
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+from ff5_wiki.rate_limiter import FF5WikiRateLimiter
+
+
+class FF5WikiTransport():
+    '''
+    The transport layer used for all the I/O towards the wiki.
+    It keeps a persistent session with a pool of connections, limits the request rate via a token bucket, retries transient failures
+    (429, 5xx, connection errors and timeouts) with exponential backoff (honouring Retry-After), and sends conditional requests
+    (If-None-Match/If-Modified-Since) for URLs it has already seen.
+    Only the most recently used successful responses carrying validators are kept for the latter, up to `max_cached_responses`.
+    '''
+    __READY_ONLY_ERROR_MSG: str = "This attribute cannot be changed after initialisation."
+    __RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    __NOT_MODIFIED_STATUS_CODE: int = 304
+    __USER_AGENT: str = "ff5-wiki-utils (https://github.com/cloudstrife9999/ff5-wiki-utils)"
+
+    def __init__(self, connect_timeout: float=3.05, read_timeout: float=10.0, max_retries: int=5, backoff_factor: float=0.5, max_backoff: float=60.0, rate: float=5.0, burst: int=5, pool_size: int=10, max_cached_responses: int=256) -> None:
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError(f"The timeouts must be positive, got ({connect_timeout}, {read_timeout}).")
+        elif max_retries < 0:
+            raise ValueError(f"The maximum number of retries cannot be negative, got {max_retries}.")
+        elif backoff_factor < 0:
+            raise ValueError(f"The backoff factor cannot be negative, got {backoff_factor}.")
+        elif max_backoff < 0:
+            raise ValueError(f"The maximum backoff cannot be negative, got {max_backoff}.")
+        elif max_cached_responses < 0:
+            raise ValueError(f"The maximum number of cached responses cannot be negative, got {max_cached_responses}.")
+
+        self.__timeout: tuple[float, float] = (connect_timeout, read_timeout)
+        self.__max_retries: int = max_retries
+        self.__backoff_factor: float = backoff_factor
+        self.__max_backoff: float = max_backoff
+        self.__rate_limiter: FF5WikiRateLimiter = FF5WikiRateLimiter(rate=rate, capacity=burst)
+        self.__session: Session = self.__init_session(pool_size=pool_size)
+        self.__max_cached_responses: int = max_cached_responses
+        self.__cached_responses: OrderedDict[tuple[str, str], Response] = OrderedDict()
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        '''
+        The (connect, read) timeouts, in seconds, of every request.
+        '''
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, _: Any) -> None:
+        raise AttributeError(FF5WikiTransport.__READY_ONLY_ERROR_MSG)
+
+    @property
+    def max_retries(self) -> int:
+        '''
+        The maximum number of times a request is retried after a transient failure.
+        '''
+        return self.__max_retries
+
+    @max_retries.setter
+    def max_retries(self, _: Any) -> None:
+        raise AttributeError(FF5WikiTransport.__READY_ONLY_ERROR_MSG)
+
+    def head(self, url: str) -> Response:
+        '''
+        Send a HEAD request. Redirects are not followed.
+        Args:
+            url (str): The URL to send the request to.
+        Returns:
+            Response: The response (or the cached response, if the server answered 304 Not Modified).
+        Raises:
+            requests.HTTPError: If the server kept answering with a transient error status code after all retries.
+            requests.ConnectionError: If the connection kept failing after all retries.
+            requests.Timeout: If the request kept timing out after all retries.
+        '''
+        return self.__request(method="HEAD", url=url, allow_redirects=False)
+
+    def get(self, url: str) -> Response:
+        '''
+        Send a GET request. Redirects are followed.
+        Args:
+            url (str): The URL to send the request to.
+        Returns:
+            Response: The response (or the cached response, if the server answered 304 Not Modified).
+        Raises:
+            requests.HTTPError: If the server kept answering with a transient error status code after all retries.
+            requests.ConnectionError: If the connection kept failing after all retries.
+            requests.Timeout: If the request kept timing out after all retries.
+        '''
+        return self.__request(method="GET", url=url, allow_redirects=True)
+
+    def close(self) -> None:
+        '''
+        Close the underlying session and all of its pooled connections.
+        '''
+        self.__session.close()
+
+    def __init_session(self, pool_size: int) -> Session:
+        session: Session = Session()
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)  # Retries are handled by this class.
+
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = FF5WikiTransport.__USER_AGENT
+
+        return session
+
+    def __request(self, method: str, url: str, allow_redirects: bool) -> Response:
+        cache_key: tuple[str, str] = (method, url)
+        headers: dict[str, str] = self.__get_conditional_headers(cache_key=cache_key)
+
+        for attempt in range(self.__max_retries + 1):
+            is_last_attempt: bool = attempt == self.__max_retries
+
+            self.__rate_limiter.acquire()
+
+            try:
+                response: Response = self.__session.request(method=method, url=url, headers=headers, timeout=self.__timeout, allow_redirects=allow_redirects)
+            except (RequestsConnectionError, Timeout):
+                if is_last_attempt:
+                    raise
+
+                sleep(self.__get_backoff(attempt=attempt))
+
+                continue
+
+            if response.status_code == FF5WikiTransport.__NOT_MODIFIED_STATUS_CODE and cache_key in self.__cached_responses:
+                self.__cached_responses.move_to_end(cache_key)
+
+                return self.__cached_responses[cache_key]
+            elif response.status_code in FF5WikiTransport.__RETRYABLE_STATUS_CODES:
+                if is_last_attempt:
+                    response.raise_for_status()
+
+                retry_after: Optional[float] = self.__get_retry_after(response=response)
+
+                sleep(self.__get_backoff(attempt=attempt) if retry_after is None else retry_after)
+
+                continue
+            else:
+                self.__cache_response(cache_key=cache_key, response=response)
+
+                return response
+
+        raise AssertionError("Unreachable: the last attempt either returns or raises.")
+
+    def __get_conditional_headers(self, cache_key: tuple[str, str]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        cached_response: Optional[Response] = self.__cached_responses.get(cache_key)
+
+        if cached_response is None:
+            return headers
+
+        if "ETag" in cached_response.headers:
+            headers["If-None-Match"] = cached_response.headers["ETag"]
+
+        if "Last-Modified" in cached_response.headers:
+            headers["If-Modified-Since"] = cached_response.headers["Last-Modified"]
+
+        return headers
+
+    def __cache_response(self, cache_key: tuple[str, str], response: Response) -> None:
+        '''
+        Keep a successful response carrying validators for later conditional requests, evicting the least recently used one if the cache is full.
+        Args:
+            cache_key (tuple[str, str]): The method and the URL of the request.
+            response (Response): The response to cache.
+        '''
+        if not 200 <= response.status_code < 300 or not ("ETag" in response.headers or "Last-Modified" in response.headers) or self.__max_cached_responses == 0:
+            return
+
+        self.__cached_responses[cache_key] = response
+        self.__cached_responses.move_to_end(cache_key)
+
+        if len(self.__cached_responses) > self.__max_cached_responses:
+            self.__cached_responses.popitem(last=False)
+
+    def __get_backoff(self, attempt: int) -> float:
+        return min(self.__max_backoff, self.__backoff_factor * 2.0 ** attempt)
+
+    def __get_retry_after(self, response: Response) -> Optional[float]:
+        '''
+        Parse the Retry-After header of a response, which may be either a number of seconds or an HTTP date.
+        Args:
+            response (Response): The response to parse the header from.
+        Returns:
+            Optional[float]: The number of seconds to wait (capped to the maximum backoff), or None if the header is missing or malformed.
+        '''
+        retry_after: Optional[str] = response.headers.get("Retry-After")
+
+        if not retry_after:
+            return None
+        elif retry_after.strip().isdigit():
+            return min(self.__max_backoff, float(retry_after))
+
+        try:
+            retry_date: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+        return min(self.__max_backoff, max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds()))
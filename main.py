@@ -3,10 +3,12 @@
 from ff5_wiki.bestiary import FF5Bestiary
 from ff5_wiki.common import FF5Wiki
 from ff5_wiki.item import FF5Item
+from ff5_wiki.renderer import FF5WikiReferenceRenderer
 
 
 if __name__ == "__main__":
     bestiary: FF5Bestiary = FF5Bestiary(enemy_list_file=FF5Wiki.ENEMY_FILE, boss_list_file=FF5Wiki.BOSS_FILE)
+    renderer: FF5WikiReferenceRenderer = FF5WikiReferenceRenderer()
     item_list: list[str] = []
 
     with open(FF5Wiki.ITEM_FILE, "r") as i_f:
@@ -14,9 +16,11 @@ if __name__ == "__main__":
             if len(elm) > 1:
                 item_list.append(elm.strip())
 
-    for elm in item_list:
-        ff5_item: FF5Item = FF5Item(name=elm, bestiary=bestiary)
+    print(renderer.render_catalogue(items=(FF5Item(name=elm, bestiary=bestiary) for elm in item_list)), end="")
 
-        print(ff5_item.name)
-        print(ff5_item.get_wiki_ready_references())
-        print("----------")
+    # Each version only differs in a few rows, so only the items its overlay touches are recomputed and printed.
+    for version, overlay_file in FF5Wiki.VERSION_OVERLAY_FILES.items():
+        version_bestiary: FF5Bestiary = bestiary.apply_overlay(overlay_file=overlay_file)
+
+        print(f"========== {version} ==========")
+        print(renderer.render_catalogue(items=(FF5Item(name=elm, bestiary=version_bestiary) for elm in item_list if elm in version_bestiary.touched_items)), end="")
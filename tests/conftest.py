@@ -0,0 +1,19 @@
+from typing import Iterator
+from pathlib import Path
+from sys import path
+
+from pytest import MonkeyPatch, fixture
+
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+
+# The package and its data files (e.g., FF5Wiki.ENEMY_FILE) are addressed relative to the repository root, as in main.py.
+if str(REPO_ROOT) not in path:
+    path.insert(0, str(REPO_ROOT))
+
+
+@fixture(autouse=True)
+def run_from_repo_root(monkeypatch: MonkeyPatch) -> Iterator[None]:
+    monkeypatch.chdir(REPO_ROOT)
+
+    yield
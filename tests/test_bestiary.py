@@ -0,0 +1,123 @@
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from ff5_wiki.bestiary import FF5Bestiary
+from ff5_wiki.common import FF5Wiki
+from ff5_wiki.enemy import FF5Enemy
+
+
+HEADER: str = "Name,Wiki page type,Common Steal,Rare Steal,Common Drop,Rare Drop\n"
+OVERLAY_HEADER: str = "Action,Boss,Name,Wiki page type,Common Steal,Rare Steal,Common Drop,Rare Drop\n"
+
+
+def write(path: Path, content: str) -> str:
+    path.write_text(content)
+
+    return str(path)
+
+
+def full_scan(bestiary: FF5Bestiary, item: str) -> tuple[FF5Enemy, ...]:
+    return tuple(enemy for enemy in bestiary.all_enemies if item in (enemy.common_steal, enemy.rare_steal, enemy.common_drop, enemy.rare_drop))
+
+
+def assert_index_matches_full_scan(bestiary: FF5Bestiary) -> None:
+    items: set[str] = {item for enemy in bestiary.all_enemies for item in (enemy.common_steal, enemy.rare_steal, enemy.common_drop, enemy.rare_drop) if item}
+
+    for item in items | {"Leather Cap", "Ether", "Not An Item"}:
+        assert bestiary.get_enemies_with_item(item=item) == full_scan(bestiary=bestiary, item=item), item
+
+
+@fixture
+def bestiary(tmp_path: Path) -> FF5Bestiary:
+    enemy_file: str = write(tmp_path / "enemies.csv", HEADER + "Goblin (regular),2,Potion,Potion,,Leather Cap\nSteel Bat,2,,Potion,,\nDevil Crab,2,,Potion,,\n")
+    boss_file: str = write(tmp_path / "bosses.csv", HEADER + "Karlabos (boss),2,Potion,Potion,Tent,Tent\nSteel Bat,2,Ether,,,\n")
+
+    return FF5Bestiary(enemy_list_file=enemy_file, boss_list_file=boss_file)
+
+
+def overlay(bestiary: FF5Bestiary, tmp_path: Path, rows: str, name: str="overlay.csv") -> FF5Bestiary:
+    return bestiary.apply_overlay(overlay_file=write(tmp_path / name, OVERLAY_HEADER + rows))
+
+
+def names(enemies: list[FF5Enemy] | tuple[FF5Enemy, ...]) -> list[str]:
+    return [enemy.name for enemy in enemies]
+
+
+def test_index_matches_full_scan_on_shipped_data() -> None:
+    assert_index_matches_full_scan(bestiary=FF5Bestiary(enemy_list_file=FF5Wiki.ENEMY_FILE, boss_list_file=FF5Wiki.BOSS_FILE))
+
+
+def test_add(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    derived: FF5Bestiary = overlay(bestiary, tmp_path, "add,1,Siren (boss),2,,,Bronze Armor,Ether\n")
+
+    assert names(derived.bosses) == ["Karlabos (boss)", "Steel Bat", "Siren (boss)"]
+    assert derived.touched_items == {"Bronze Armor", "Ether"}
+    assert_index_matches_full_scan(bestiary=derived)
+
+
+def test_replace_keeps_position(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    derived: FF5Bestiary = overlay(bestiary, tmp_path, "replace,0,Steel Bat,2,,Ether,,\n")
+
+    assert names(derived.enemies) == ["Goblin (regular)", "Steel Bat", "Devil Crab"]
+    assert derived.touched_items == {"Potion", "Ether"}
+    assert names(derived.get_enemies_with_item(item="Potion")) == ["Goblin (regular)", "Devil Crab", "Karlabos (boss)"]
+    assert_index_matches_full_scan(bestiary=derived)
+
+
+def test_remove_with_name_only(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    derived: FF5Bestiary = overlay(bestiary, tmp_path, "remove,0,Goblin (regular)\n")
+
+    assert names(derived.enemies) == ["Steel Bat", "Devil Crab"]
+    assert derived.touched_items == {"Potion", "Leather Cap"}
+    assert derived.get_enemies_with_item(item="Leather Cap") == ()
+    assert names(derived.get_enemies_with_item(item="Potion")) == ["Steel Bat", "Devil Crab", "Karlabos (boss)"]
+    assert_index_matches_full_scan(bestiary=derived)
+
+
+def test_boss_flag_selects_the_list(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    derived: FF5Bestiary = overlay(bestiary, tmp_path, "remove,1,Steel Bat\n")
+
+    assert names(derived.enemies) == ["Goblin (regular)", "Steel Bat", "Devil Crab"]
+    assert names(derived.bosses) == ["Karlabos (boss)"]
+    assert derived.touched_items == {"Ether"}
+    assert_index_matches_full_scan(bestiary=derived)
+
+
+def test_untouched_entries_are_shared(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    derived: FF5Bestiary = overlay(bestiary, tmp_path, "replace,1,Steel Bat,2,Hi-Potion,,,\n")
+
+    assert derived.enemies[0] is bestiary.enemies[0]
+    assert derived.get_enemies_with_item(item="Potion") is bestiary.get_enemies_with_item(item="Potion")
+    assert isinstance(derived.get_enemies_with_item(item="Potion"), tuple)
+    assert names(bestiary.bosses) == ["Karlabos (boss)", "Steel Bat"] and bestiary.bosses[1].common_steal == "Ether"
+
+
+def test_chained_overlays(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    first: FF5Bestiary = overlay(bestiary, tmp_path, "add,0,Killer Bee,2,,Ether,,\n", name="first.csv")
+    second: FF5Bestiary = overlay(first, tmp_path, "remove,0,Killer Bee\nremove,0,Devil Crab\n", name="second.csv")
+
+    assert names(second.enemies) == ["Goblin (regular)", "Steel Bat"]
+    assert second.touched_items == {"Ether", "Potion"}
+    assert names(first.enemies) == ["Goblin (regular)", "Steel Bat", "Devil Crab", "Killer Bee"]
+    assert_index_matches_full_scan(bestiary=first)
+    assert_index_matches_full_scan(bestiary=second)
+
+
+def test_blank_lines_are_skipped(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    assert names(overlay(bestiary, tmp_path, "\n,,,,,,,\n").all_enemies) == names(bestiary.all_enemies)
+
+
+def test_invalid_lines_are_rejected(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    for rows, message in (
+        ("replace,0,Steel Bat\n", "line 2"),
+        ("add,0,Killer Bee,2,,Ether\n", "got 6"),
+        ("delete,0,Steel Bat\n", "Unknown overlay action"),
+        ("add,yes,Killer Bee,2,,Ether,,\n", "Unknown boss flag"),
+        ("add,0,Steel Bat,2,,,,\n", "already"),
+        ("remove,1,Devil Crab\n", "not in the bestiary"),
+        ("add,0,,2,,,,\n", "line 2: Enemy name cannot be empty"),
+        ("replace,0,Steel Bat,9,,Ether,,\n", "line 2: 9 is not a valid FF5EnemyPageType")
+    ):
+        with raises(ValueError, match=message):
+            overlay(bestiary, tmp_path, rows)
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from ff5_wiki.bestiary import FF5Bestiary
+from ff5_wiki.common import FF5Wiki
+from ff5_wiki.item import FF5Item
+from ff5_wiki.renderer import FF5WikiReferenceRenderer
+
+
+HEADER: str = "Name,Wiki page type,Common Steal,Rare Steal,Common Drop,Rare Drop\n"
+
+
+@fixture
+def bestiary() -> FF5Bestiary:
+    return FF5Bestiary(enemy_list_file=FF5Wiki.ENEMY_FILE, boss_list_file=FF5Wiki.BOSS_FILE)
+
+
+@fixture
+def item_list() -> list[str]:
+    with open(FF5Wiki.ITEM_FILE, "r") as i_f:
+        return [elm.strip() for elm in i_f.readlines() if len(elm) > 1]
+
+
+def test_catalogue_matches_item_references(bestiary: FF5Bestiary, item_list: list[str]) -> None:
+    items: list[FF5Item] = [FF5Item(name=elm, bestiary=bestiary) for elm in item_list]
+    expected: str = "".join(f"{item.name}\n{item.get_wiki_ready_references()}\n----------\n" for item in items)
+
+    assert FF5WikiReferenceRenderer().render_catalogue(items=items) == expected
+
+
+def test_custom_template(bestiary: FF5Bestiary) -> None:
+    renderer: FF5WikiReferenceRenderer = FF5WikiReferenceRenderer(section_prefixes=tuple(f"{i}: " for i in range(7)), separator=" / ", newline="\n")
+    item: FF5Item = FF5Item(name="Potion", bestiary=bestiary)
+    rendered: str = renderer.render(item=item)
+
+    assert rendered.startswith("0: ") and "<br/>" not in rendered
+    assert rendered.count("\n") == sum(1 for enemies in item.sources if enemies) - 1
+
+    with raises(ValueError):
+        FF5WikiReferenceRenderer(section_prefixes=("Only one: ",))
+
+
+def test_same_sources_share_a_cache_entry(tmp_path: Path) -> None:
+    enemy_file: Path = tmp_path / "enemies.csv"
+    boss_file: Path = tmp_path / "bosses.csv"
+
+    enemy_file.write_text(HEADER + "Goblin (regular),2,Potion,Potion,Tent,Tent\nSteel Bat,2,,Ether,,\n")
+    boss_file.write_text(HEADER)
+
+    bestiary: FF5Bestiary = FF5Bestiary(enemy_list_file=str(enemy_file), boss_list_file=str(boss_file))
+    renderer: FF5WikiReferenceRenderer = FF5WikiReferenceRenderer()
+    potion: str = renderer.render(item=FF5Item(name="Potion", bestiary=bestiary))
+    tent: str = renderer.render(item=FF5Item(name="Tent", bestiary=bestiary))
+
+    assert renderer.render(item=FF5Item(name="Potion", bestiary=bestiary)) is potion
+    assert tent != potion  # Same enemy, but in a different section.
+
+
+def test_untouched_overlay_items_hit_the_cache(bestiary: FF5Bestiary, tmp_path: Path) -> None:
+    overlay_file: Path = tmp_path / "overlay.csv"
+
+    overlay_file.write_text("Action,Boss,Name,Wiki page type,Common Steal,Rare Steal,Common Drop,Rare Drop\nremove,0,Goblin (regular)\n")
+
+    version_bestiary: FF5Bestiary = bestiary.apply_overlay(overlay_file=str(overlay_file))
+    renderer: FF5WikiReferenceRenderer = FF5WikiReferenceRenderer()
+
+    assert "Hi-Potion" not in version_bestiary.touched_items and "Potion" in version_bestiary.touched_items
+    assert renderer.render(item=FF5Item(name="Hi-Potion", bestiary=version_bestiary)) is renderer.render(item=FF5Item(name="Hi-Potion", bestiary=bestiary))
+    assert renderer.render(item=FF5Item(name="Potion", bestiary=version_bestiary)) != renderer.render(item=FF5Item(name="Potion", bestiary=bestiary))
@@ -0,0 +1,183 @@
+from typing import Any, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import monotonic
+
+from pytest import fixture, raises
+from requests import ConnectionError as RequestsConnectionError, HTTPError
+
+from ff5_wiki.rate_limiter import FF5WikiRateLimiter
+from ff5_wiki.transport import FF5WikiTransport
+
+
+class FaultInjectingStub():
+    '''
+    A local HTTP server answering each path with a scripted sequence of (status, headers) responses (the last one is repeated).
+    It answers 304 whenever the request carries an If-None-Match header matching the ETag of the response it would send.
+    '''
+
+    def __init__(self) -> None:
+        self.scripts: dict[str, list[tuple[int, dict[str, str]]]] = {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.__server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), self.__make_handler())
+        self.__thread: Thread = Thread(target=self.__server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.__server.server_port}"
+
+    def start(self) -> None:
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def hits(self, path: str) -> int:
+        return sum(1 for requested_path, _ in self.requests if requested_path == path)
+
+    def __make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub: FaultInjectingStub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_HEAD(self) -> None:
+                self.__answer()
+
+            def do_GET(self) -> None:
+                self.__answer()
+
+            def __answer(self) -> None:
+                stub.requests.append((self.path, dict(self.headers.items())))
+                script: list[tuple[int, dict[str, str]]] = stub.scripts.get(self.path, [(404, {})])
+                status, headers = script.pop(0) if len(script) > 1 else script[0]
+
+                if "ETag" in headers and self.headers.get("If-None-Match") == headers["ETag"]:
+                    status, headers = 304, {}
+
+                self.send_response(status)
+
+                for name, value in headers.items():
+                    self.send_header(name, value)
+
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        return Handler
+
+
+@fixture
+def stub() -> Iterator[FaultInjectingStub]:
+    server: FaultInjectingStub = FaultInjectingStub()
+
+    server.start()
+
+    yield server
+
+    server.stop()
+
+
+def make_transport(**kwargs: Any) -> FF5WikiTransport:
+    options: dict[str, Any] = {"max_retries": 3, "backoff_factor": 0.01, "max_backoff": 0.05, "rate": 1000.0, "burst": 100}
+
+    options.update(kwargs)
+
+    return FF5WikiTransport(**options)
+
+
+def test_retries_429_until_success(stub: FaultInjectingStub) -> None:
+    stub.scripts["/flaky"] = [(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"}), (200, {})]
+
+    assert make_transport().head(url=f"{stub.url}/flaky").status_code == 200
+    assert stub.hits("/flaky") == 3
+
+
+def test_retry_after_zero_is_honoured(stub: FaultInjectingStub) -> None:
+    stub.scripts["/busy"] = [(503, {"Retry-After": "0"})] * 3 + [(200, {})]
+    start: float = monotonic()
+
+    assert make_transport(backoff_factor=1.0, max_backoff=10.0).head(url=f"{stub.url}/busy").status_code == 200
+    assert monotonic() - start < 0.5
+
+
+def test_exhausted_retries_raise_http_error(stub: FaultInjectingStub) -> None:
+    stub.scripts["/throttled"] = [(429, {"Retry-After": "0"})]
+
+    with raises(HTTPError) as error:
+        make_transport(max_retries=2).head(url=f"{stub.url}/throttled")
+
+    assert error.value.response is not None and error.value.response.status_code == 429
+    assert stub.hits("/throttled") == 3
+
+
+def test_missing_page_is_not_retried(stub: FaultInjectingStub) -> None:
+    assert make_transport().head(url=f"{stub.url}/missing").status_code == 404
+    assert stub.hits("/missing") == 1
+
+
+def test_connection_errors_are_retried_then_raised(stub: FaultInjectingStub) -> None:
+    url: str = stub.url
+
+    stub.stop()
+
+    with raises(RequestsConnectionError):
+        make_transport(max_retries=1).head(url=f"{url}/gone")
+
+
+def test_not_modified_reuses_cached_response(stub: FaultInjectingStub) -> None:
+    stub.scripts["/page"] = [(200, {"ETag": "\"v1\""})]
+    transport: FF5WikiTransport = make_transport()
+
+    first = transport.head(url=f"{stub.url}/page")
+    second = transport.head(url=f"{stub.url}/page")
+
+    assert second is first and second.status_code == 200
+    assert "If-None-Match" not in stub.requests[0][1]
+    assert stub.requests[1][1]["If-None-Match"] == "\"v1\""
+
+
+def test_unsuccessful_responses_are_not_cached(stub: FaultInjectingStub) -> None:
+    stub.scripts["/deleted"] = [(404, {"ETag": "\"v1\""})]
+    transport: FF5WikiTransport = make_transport()
+
+    transport.head(url=f"{stub.url}/deleted")
+    transport.head(url=f"{stub.url}/deleted")
+
+    assert all("If-None-Match" not in headers for _, headers in stub.requests)
+
+
+def test_cache_evicts_least_recently_used(stub: FaultInjectingStub) -> None:
+    stub.scripts["/a"] = [(200, {"ETag": "\"a\""})]
+    stub.scripts["/b"] = [(200, {"ETag": "\"b\""})]
+    transport: FF5WikiTransport = make_transport(max_cached_responses=1)
+
+    transport.head(url=f"{stub.url}/a")
+    transport.head(url=f"{stub.url}/b")
+    transport.head(url=f"{stub.url}/a")
+
+    assert "If-None-Match" not in stub.requests[2][1]
+
+
+def test_request_rate_is_limited(stub: FaultInjectingStub) -> None:
+    stub.scripts["/page"] = [(200, {})]
+    transport: FF5WikiTransport = make_transport(rate=20.0, burst=1)
+    start: float = monotonic()
+
+    for _ in range(6):
+        transport.head(url=f"{stub.url}/page")
+
+    assert monotonic() - start >= 0.2
+
+
+def test_invalid_settings_are_rejected() -> None:
+    for kwargs in ({"connect_timeout": 0}, {"read_timeout": -1}, {"max_retries": -1}, {"backoff_factor": -1}, {"max_backoff": -1}, {"max_cached_responses": -1}):
+        with raises(ValueError):
+            FF5WikiTransport(**kwargs)
+
+    with raises(ValueError):
+        FF5WikiRateLimiter(rate=0, capacity=1)
+
+    with raises(ValueError):
+        FF5WikiRateLimiter(rate=1, capacity=0)